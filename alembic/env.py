@@ -1,8 +1,8 @@
 import asyncio
 from logging.config import fileConfig
 
-from sqlalchemy.ext.asyncio import AsyncEngine
-from sqlalchemy import pool, create_engine # create_engine for offline mode with sync URL if needed, or adjust offline mode
+from sqlalchemy import pool
+from sqlalchemy.ext.asyncio import create_async_engine
 
 from alembic import context
 
@@ -66,7 +66,7 @@ async def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    connectable = AsyncEngine(create_engine(DB_URL, poolclass=pool.NullPool, echo=settings.db.echo))
+    connectable = create_async_engine(DB_URL, poolclass=pool.NullPool, echo=settings.db.echo)
 
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
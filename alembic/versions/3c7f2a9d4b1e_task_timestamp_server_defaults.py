@@ -0,0 +1,30 @@
+"""task_timestamp_server_defaults
+
+Revision ID: 3c7f2a9d4b1e
+Revises: 9e0d81720d41
+Create Date: 2026-10-15 08:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7f2a9d4b1e'
+down_revision: Union[str, None] = '9e0d81720d41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('tasks', 'created_at', server_default=sa.text('now()'))
+    op.alter_column('tasks', 'updated_at', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('tasks', 'updated_at', server_default=None)
+    op.alter_column('tasks', 'created_at', server_default=None)
@@ -1,24 +1,127 @@
 """Task management API endpoints module."""
 
-from typing import List
+from typing import AsyncIterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Body, Depends, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud.exeptions import CRUDException, NotFoundError
+from app.crud.exeptions import NotFoundError
 from app.crud.task import TaskCRUD
-from app.dependencies import get_db_session, get_task_crud
+from app.dependencies import get_db_session, get_response_cache, get_stream_db_session, get_task_crud
+from app.infrastructure.cache import ResponseCache
+from app.infrastructure.config import settings
 from app.infrastructure.logger import logger
+from app.models.task import Task as TaskModel
 from app.schemas.task import Task, TaskCreate, TaskUpdate
 
 router = APIRouter(tags=["tasks"])
 
+# Fields of the Task response schema, read straight from ORM rows
+_TASK_FIELDS = tuple(Task.model_fields)
+
+_TASK_LIST_CACHE_PATTERN = "tasks:list:*"
+
+# Upper bound of the page size of list endpoints
+MAX_PAGE_SIZE = 1000
+
+# Upper bound of the offset of list endpoints; OFFSET is sent as int4
+MAX_OFFSET = 2 ** 31 - 1
+
+# Upper bound of the number of tasks in a single bulk request
+MAX_BULK_SIZE = 1000
+
+
+def _task_dict(task: TaskModel) -> dict:
+    """Collect the response fields of an ORM task.
+
+    Rows coming from the database are already valid, so they are encoded
+    with orjson directly instead of being validated into the Task schema.
+    """
+    return {field: getattr(task, field) for field in _TASK_FIELDS}
+
+
+def _task_json(task: TaskModel) -> bytes:
+    """Encode a single ORM task into JSON bytes."""
+    return orjson.dumps(_task_dict(task))
+
+
+def _task_list_json(tasks: List[TaskModel]) -> bytes:
+    """Encode a list of ORM tasks into JSON bytes in a single call."""
+    return orjson.dumps([_task_dict(task) for task in tasks])
+
+
+def _json_response(content: bytes, status_code: int = status.HTTP_200_OK) -> Response:
+    """Wrap already encoded JSON into a response.
+
+    Returning a ``Response`` directly makes FastAPI skip ``response_model``
+    validation, which is kept on the routes only for the OpenAPI schema.
+    """
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+
+def _task_cache_key(task_id: int) -> str:
+    """Get the response cache key of a single task."""
+    return f"tasks:{task_id}"
+
+
+def _task_list_cache_key(skip: int, limit: int) -> str:
+    """Get the response cache key of a task list page."""
+    return f"tasks:list:{skip}:{limit}"
+
+
+async def _stream_task_list(
+        first: Optional[TaskModel],
+        tasks: AsyncIterator[TaskModel],
+        db: AsyncSession,
+        cache: ResponseCache,
+        cache_key: str,
+) -> AsyncIterator[bytes]:
+    """Encode tasks into a JSON array while they are fetched from the database.
+
+    The first row is fetched by the endpoint before the response starts,
+    so errors raised when the query is executed still reach the exception
+    handlers. ``db`` comes from ``get_stream_db_session``, which FastAPI
+    does not close, so the cursor stays usable and the stream closes the
+    session when done. When caching is enabled, the complete body is
+    stored after the last row.
+    """
+    chunks: Optional[List[bytes]] = [] if cache.enabled else None
+    count = 0
+    try:
+        yield b"["
+        if first is not None:
+            chunk = _task_json(first)
+            if chunks is not None:
+                chunks.append(chunk)
+            yield chunk
+            count = 1
+            async for task in tasks:
+                chunk = b"," + _task_json(task)
+                if chunks is not None:
+                    chunks.append(chunk)
+                yield chunk
+                count += 1
+        yield b"]"
+        logger.info("Fetched %s tasks", count)
+        if chunks is not None:
+            body = b"[" + b"".join(chunks) + b"]"
+            await cache.set(cache_key, body, settings.cache.task_list_ttl)
+    except Exception:
+        # Raised after the response has started, so no exception handler applies
+        logger.exception("Failed to fetch tasks")
+        raise
+    finally:
+        await db.close()
+
 
 @router.post("/create", response_model=Task, status_code=status.HTTP_201_CREATED)
 async def create_new_task_endpoint(
         task_payload: TaskCreate,
         db: AsyncSession = Depends(get_db_session),
-        task_crud: TaskCRUD = Depends(get_task_crud)
+        task_crud: TaskCRUD = Depends(get_task_crud),
+        cache: ResponseCache = Depends(get_response_cache),
 ):
     """Create a new task record in the database.
     
@@ -26,6 +129,7 @@ async def create_new_task_endpoint(
         task_payload (TaskCreate): Task creation data including datetime and info
         db (AsyncSession): Database session
         task_crud (TaskCRUD): Task CRUD operations handler
+        cache (ResponseCache): Response cache
         
     Returns:
         Task: Created task data
@@ -34,47 +138,117 @@ async def create_new_task_endpoint(
         - datetime_to_do: Expected execution time for the task (UTC recommended)
         - task_info: Information about the task
     """
-    try:
-        task = await task_crud.create(db=db, obj_in=task_payload)
-        logger.info(f"Task created: ID={task.id}")
-        return task
-    except CRUDException as e:
-        logger.exception("Unhandled CRUDException during creation")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    task = await task_crud.create(db=db, obj_in=task_payload)
+    logger.info("Task created: ID=%s", task.id)
+    await cache.invalidate(pattern=_TASK_LIST_CACHE_PATTERN)
+    return _json_response(_task_json(task), status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/list", response_model=List[Task])
 async def read_all_tasks_endpoint(
-        skip: int = 0,
-        limit: int = 100,
-        db: AsyncSession = Depends(get_db_session),
-        task_crud: TaskCRUD = Depends(get_task_crud)
+        skip: int = Query(0, ge=0, le=MAX_OFFSET),
+        limit: int = Query(100, ge=0, le=MAX_PAGE_SIZE),
+        db: AsyncSession = Depends(get_stream_db_session),
+        task_crud: TaskCRUD = Depends(get_task_crud),
+        cache: ResponseCache = Depends(get_response_cache),
 ):
     """Retrieve a list of all tasks with pagination support.
     
     Args:
-        skip (int): Number of records to skip (for pagination)
-        limit (int): Maximum number of records to return (for pagination)
-        db (AsyncSession): Database session
+        skip (int): Number of records to skip (for pagination),
+            at most ``MAX_OFFSET``
+        limit (int): Maximum number of records to return (for pagination),
+            at most ``MAX_PAGE_SIZE``
+        db (AsyncSession): Database session owned by the response stream
         task_crud (TaskCRUD): Task CRUD operations handler
+        cache (ResponseCache): Response cache
         
     Returns:
         List[Task]: List of task records
+
+    Note:
+        Rows are streamed from a server-side cursor and encoded one by one,
+        so the full list is never materialized in memory. Pages are served
+        from the response cache for ``cache.task_list_ttl`` seconds.
     """
+    cache_key = _task_list_cache_key(skip, limit)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        await db.close()
+        return _json_response(cached)
+    tasks = task_crud.iter_many(db=db, skip=skip, limit=limit)
     try:
-        tasks = await task_crud.get_many(db=db, skip=skip, limit=limit)
-        logger.info(f"Fetched {len(tasks)} tasks")
-        return tasks
-    except CRUDException as e:
-        logger.exception("Failed to fetch tasks")
-        raise HTTPException(status_code=500, detail="Internal server error")
+        first: Optional[TaskModel] = await tasks.__anext__()
+    except StopAsyncIteration:
+        first = None
+    except Exception:
+        await db.close()
+        raise
+    return StreamingResponse(
+        _stream_task_list(first, tasks, db, cache, cache_key),
+        media_type="application/json",
+    )
+
+
+@router.post("/bulk", response_model=List[Task], status_code=status.HTTP_201_CREATED)
+async def bulk_create_tasks_endpoint(
+        tasks_payload: List[TaskCreate] = Body(..., min_length=1, max_length=MAX_BULK_SIZE),
+        db: AsyncSession = Depends(get_db_session),
+        task_crud: TaskCRUD = Depends(get_task_crud),
+        cache: ResponseCache = Depends(get_response_cache),
+):
+    """Create several task records with a single insert and commit.
+
+    Args:
+        tasks_payload (List[TaskCreate]): Task creation data for every new task,
+            from 1 to ``MAX_BULK_SIZE`` items
+        db (AsyncSession): Database session
+        task_crud (TaskCRUD): Task CRUD operations handler
+        cache (ResponseCache): Response cache
+
+    Returns:
+        List[Task]: Created tasks in request order
+    """
+    tasks = await task_crud.bulk_create(db=db, objs_in=tasks_payload)
+    logger.info("Tasks created: count=%s", len(tasks))
+    await cache.invalidate(pattern=_TASK_LIST_CACHE_PATTERN)
+    return _json_response(_task_list_json(tasks), status_code=status.HTTP_201_CREATED)
+
+
+@router.delete("/bulk", response_model=List[Task])
+async def bulk_delete_tasks_endpoint(
+        ids: List[int] = Query(..., min_length=1, max_length=MAX_BULK_SIZE),
+        db: AsyncSession = Depends(get_db_session),
+        task_crud: TaskCRUD = Depends(get_task_crud),
+        cache: ResponseCache = Depends(get_response_cache),
+):
+    """Delete several tasks by their IDs with a single delete and commit.
+
+    Args:
+        ids (List[int]): IDs of the tasks to delete, passed as repeated ``ids`` query
+            parameters, from 1 to ``MAX_BULK_SIZE`` items
+        db (AsyncSession): Database session
+        task_crud (TaskCRUD): Task CRUD operations handler
+        cache (ResponseCache): Response cache
+
+    Returns:
+        List[Task]: Deleted tasks; IDs that do not exist are skipped
+    """
+    deleted = await task_crud.bulk_delete(db=db, ids=ids)
+    logger.info("Tasks deleted: IDs=%s", [task.id for task in deleted])
+    await cache.invalidate(
+        *(_task_cache_key(task.id) for task in deleted),
+        pattern=_TASK_LIST_CACHE_PATTERN,
+    )
+    return _json_response(_task_list_json(deleted))
 
 
 @router.get("/{task_id}", response_model=Task)
 async def read_single_task_endpoint(
         task_id: int,
         db: AsyncSession = Depends(get_db_session),
-        task_crud: TaskCRUD = Depends(get_task_crud)
+        task_crud: TaskCRUD = Depends(get_task_crud),
+        cache: ResponseCache = Depends(get_response_cache),
 ):
     """Retrieve data for a specific task by its ID.
     
@@ -82,25 +256,29 @@ async def read_single_task_endpoint(
         task_id (int): The ID of the task to retrieve
         db (AsyncSession): Database session
         task_crud (TaskCRUD): Task CRUD operations handler
+        cache (ResponseCache): Response cache
         
     Returns:
         Task: Task data
         
     Raises:
-        HTTPException: If task with given ID is not found
+        NotFoundError: If task with given ID is not found (mapped to 404)
+
+    Note:
+        Responses are served from the response cache for ``cache.task_ttl``
+        seconds.
     """
-    try:
-        task = await task_crud.get(db, id=task_id)
-        if not task:
-            raise NotFoundError(f"Task with id={task_id} not found")
-        logger.info(f"Task fetched: ID={task.id}")
-        return task
-    except NotFoundError as e:
-        logger.warning(f"NotFoundError: {e}")
-        raise HTTPException(status_code=404, detail=str(e))
-    except CRUDException as e:
-        logger.exception("Failed to fetch task")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    cache_key = _task_cache_key(task_id)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+    task = await task_crud.get(db, id=task_id)
+    if not task:
+        raise NotFoundError(f"Task with id={task_id} not found")
+    logger.info("Task fetched: ID=%s", task.id)
+    content = _task_json(task)
+    await cache.set(cache_key, content, settings.cache.task_ttl)
+    return _json_response(content)
 
 
 @router.patch("/{task_id}/update", response_model=Task)
@@ -108,7 +286,8 @@ async def update_existing_task_endpoint(
         task_id: int,
         task_payload: TaskUpdate,
         db: AsyncSession = Depends(get_db_session),
-        task_crud: TaskCRUD = Depends(get_task_crud)
+        task_crud: TaskCRUD = Depends(get_task_crud),
+        cache: ResponseCache = Depends(get_response_cache),
 ):
     """Update data for an existing task.
     
@@ -117,37 +296,30 @@ async def update_existing_task_endpoint(
         task_payload (TaskUpdate): Updated task data
         db (AsyncSession): Database session
         task_crud (TaskCRUD): Task CRUD operations handler
+        cache (ResponseCache): Response cache
         
     Returns:
         Task: Updated task data
         
     Raises:
-        HTTPException: If task with given ID is not found
+        NotFoundError: If task with given ID is not found (mapped to 404)
         
     Note:
         - datetime_to_do (optional): New expected execution time
         - task_info (optional): New task information
     """
-    try:
-        task = await task_crud.get(db, id=task_id)
-        if not task:
-            raise NotFoundError(f"Task with id={task_id} not found")
-        updated = await task_crud.update(db=db, db_obj=task, obj_in=task_payload)
-        logger.info(f"Task updated: ID={updated.id}")
-        return updated
-    except NotFoundError as e:
-        logger.warning(f"NotFoundError: {e}")
-        raise HTTPException(status_code=404, detail=str(e))
-    except CRUDException as e:
-        logger.exception("Failed to update task")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@router.delete("/{task_id}", response_model=Task)
+    updated = await task_crud.update_by_id(db, id=task_id, obj_in=task_payload)
+    logger.info("Task updated: ID=%s", updated.id)
+    await cache.invalidate(_task_cache_key(task_id), pattern=_TASK_LIST_CACHE_PATTERN)
+    return _json_response(_task_json(updated))
+
+
+@router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task_endpoint(
         task_id: int,
         db: AsyncSession = Depends(get_db_session),
-        task_crud: TaskCRUD = Depends(get_task_crud)
+        task_crud: TaskCRUD = Depends(get_task_crud),
+        cache: ResponseCache = Depends(get_response_cache),
 ):
     """Delete a specific task by its ID.
     
@@ -155,20 +327,15 @@ async def delete_task_endpoint(
         task_id (int): The ID of the task to delete
         db (AsyncSession): Database session
         task_crud (TaskCRUD): Task CRUD operations handler
+        cache (ResponseCache): Response cache
         
     Returns:
-        Task: Deleted task data
+        Response: Empty 204 No Content response
         
     Raises:
-        HTTPException: If task with given ID is not found
+        NotFoundError: If task with given ID is not found (mapped to 404)
     """
-    try:
-        deleted = await task_crud.delete(db=db, id=task_id)
-        logger.info(f"Task deleted: ID={deleted.id}")
-        return deleted
-    except NotFoundError as e:
-        logger.warning(f"NotFoundError: {e}")
-        raise HTTPException(status_code=404, detail=str(e))
-    except CRUDException as e:
-        logger.exception("Failed to delete task")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    await task_crud.delete(db=db, id=task_id)
+    logger.info("Task deleted: ID=%s", task_id)
+    await cache.invalidate(_task_cache_key(task_id), pattern=_TASK_LIST_CACHE_PATTERN)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
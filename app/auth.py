@@ -1,10 +1,13 @@
 """Authentication module for JWT token handling and user verification."""
 
-from typing import Optional
+import time
+from typing import Optional, Tuple
 
+import jwt
+from cachetools import TTLCache
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jwt.exceptions import PyJWTError
 
 from app import schemas
 from app.infrastructure.config import settings
@@ -15,6 +18,12 @@ ACCESS_TOKEN_EXPIRE_MINUTES = settings.auth.access_token_expire_min
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# Decoded tokens keyed by the raw token string: (user data, "exp" claim)
+_token_cache: TTLCache[str, Tuple[schemas.TokenData, Optional[float]]] = TTLCache(
+    maxsize=settings.auth.token_cache_size,
+    ttl=settings.auth.token_cache_ttl,
+)
+
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> schemas.TokenData:
     """Validate JWT token and return user data.
@@ -27,20 +36,38 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> schemas.Token
         
     Raises:
         HTTPException: If token is invalid or expired
+
+    Note:
+        Successfully decoded tokens are cached for a short time, so repeated
+        requests with the same token skip signature verification. A cached
+        entry is never used past the token's own expiration time.
     """
+    cached = _token_cache.get(token)
+    if cached is not None:
+        token_data, expires_at = cached
+        if expires_at is None or expires_at > time.time():
+            return token_data
+        _token_cache.pop(token, None)
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(
+            token,
+            SECRET_KEY,
+            algorithms=[ALGORITHM],
+            options={"verify_aud": False},
+        )
         username: Optional[str] = payload.get("name")
         if username is None:
             token_data = schemas.TokenData(username="valid_user_placeholder")
         else:
             token_data = schemas.TokenData(username=username)
-    except JWTError:
+    except PyJWTError:
         raise credentials_exception
     else:
+        _token_cache[token] = (token_data, payload.get("exp"))
         return token_data
@@ -1,18 +1,50 @@
 """Base CRUD operations module."""
 
-from abc import abstractmethod
-from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
-
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from asyncpg import PostgresError
 from pydantic import BaseModel
-from sqlalchemy import update as sqlalchemy_update, delete as sqlalchemy_delete
+from sqlalchemy import (
+    Integer,
+    bindparam,
+    delete as sqlalchemy_delete,
+    insert as sqlalchemy_insert,
+    update as sqlalchemy_update,
+)
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import raiseload
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy.sql import Delete, Select, Update
 
 from app.crud.exeptions import CRUDException, CreateError, NotFoundError, DeleteError, UpdateError
 from app.infrastructure.logger import logger
 from app.models.base import Base
 
+# Session info key marking that commits are deferred to the end of a batch
+_BATCH_KEY = "crud_batch"
+# Session info key marking that an operation inside the current batch failed
+_BATCH_FAILED_KEY = "crud_batch_failed"
+
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
@@ -29,20 +61,206 @@ class BaseCRUD(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         ModelType: SQLAlchemy model class
         CreateSchemaType: Pydantic model for creation
         UpdateSchemaType: Pydantic model for updates
+
+    Attributes:
+        model (Type[Base]): SQLAlchemy model class handled by the subclass;
+            every concrete subclass must set it
+        _model_name (str): Name of the model class, cached for log messages
+        _column_names (FrozenSet[str]): Column names of the model, cached
+            once per subclass to filter create and update data without
+            introspection
+        _get_many_stmt (Select): Prebuilt paginated select statement with
+            ``skip_`` and ``limit_`` bind parameters
+        _iter_many_stmt (Select): Paginated select used for streaming, which
+            forbids lazy loads and fetches rows in batches of ``stream_yield_per``
+        _update_stmt (Update): Prebuilt update-by-ID statement with an ``id_``
+            bind parameter that returns the updated row; values are added
+            per call
+        _delete_stmt (Delete): Prebuilt delete-by-ID statement with an
+            ``id_`` bind parameter that returns the deleted row
+        _bulk_delete_stmt (Delete): Prebuilt delete statement with an
+            expanding ``ids_`` bind parameter that returns the deleted rows
+        stream_yield_per (int): Rows fetched per round-trip when streaming
+        loader_options (Tuple[ExecutableOption, ...]): Default loader options
+            of list queries, e.g. ``selectinload`` for relationships that are
+            serialized with every row
+        copy_threshold (int): Minimum number of rows for ``create_many`` to
+            load them with COPY instead of a multi-row INSERT
+        _copy_defaults (Dict[str, Callable[[], Any]]): Factories of
+            Python-side scalar and callable column defaults, which COPY does
+            not apply by itself
     """
 
-    @property
-    @abstractmethod
-    def model(self):
-        """Abstract property that must be implemented by child classes.
-        
-        Returns:
-            The SQLAlchemy model class for this CRUD operations handler.
-            
+    model: ClassVar[Type[Base]]
+    _model_name: ClassVar[str]
+    _column_names: ClassVar[FrozenSet[str]] = frozenset()
+    _get_many_stmt: ClassVar[Select]
+    _iter_many_stmt: ClassVar[Select]
+    _update_stmt: ClassVar[Update]
+    _delete_stmt: ClassVar[Delete]
+    _bulk_delete_stmt: ClassVar[Delete]
+    stream_yield_per: ClassVar[int] = 200
+    loader_options: ClassVar[Tuple[ExecutableOption, ...]] = ()
+    copy_threshold: ClassVar[int] = 100
+    _copy_defaults: ClassVar[Dict[str, Callable[[], Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Cache model metadata for concrete CRUD subclasses."""
+        super().__init_subclass__(**kwargs)
+        model = cls.__dict__.get("model")
+        if model is None:
+            return
+        cls._model_name = model.__name__
+        cls._column_names = frozenset(model.__table__.columns.keys())
+        cls._get_many_stmt = (
+            select(model)
+            .offset(bindparam("skip_", type_=Integer))
+            .limit(bindparam("limit_", type_=Integer))
+        )
+        # Lazy loads would issue a query per streamed row, so fail loudly instead
+        cls._iter_many_stmt = cls._get_many_stmt.options(raiseload("*"))
+        # The "auto" session sync evaluates WHERE in Python, which cannot read
+        # bind parameters; "fetch" syncs loaded objects from the RETURNING rows
+        cls._update_stmt = (
+            sqlalchemy_update(model)
+            .where(model.id == bindparam("id_"))
+            .returning(model)
+            .execution_options(synchronize_session="fetch")
+        )
+        cls._delete_stmt = (
+            sqlalchemy_delete(model)
+            .where(model.id == bindparam("id_"))
+            .returning(model)
+            .execution_options(synchronize_session="fetch")
+        )
+        cls._bulk_delete_stmt = (
+            sqlalchemy_delete(model)
+            .where(model.id.in_(bindparam("ids_", expanding=True)))
+            .returning(model)
+            .execution_options(synchronize_session="fetch")
+        )
+        cls._copy_defaults = {
+            column.name: cls._default_factory(column.default)
+            for column in model.__table__.columns
+            if column.default is not None
+            and (column.default.is_scalar or column.default.is_callable)
+        }
+
+    @staticmethod
+    def _default_factory(default: Any) -> Callable[[], Any]:
+        """Get a zero-argument factory for a Python-side column default.
+
+        SQLAlchemy wraps callable defaults to accept an execution context,
+        which none of the model defaults use, so ``None`` is passed instead.
+        """
+        if default.is_callable:
+            return lambda: default.arg(None)
+        return lambda: default.arg
+
+    @staticmethod
+    async def _commit(db: AsyncSession) -> None:
+        """Commit the session, or only flush it inside a ``batch`` block.
+
+        Args:
+            db (AsyncSession): Database session
+        """
+        if db.info.get(_BATCH_KEY):
+            await db.flush()
+        else:
+            await db.commit()
+
+    @staticmethod
+    async def _rollback(db: AsyncSession) -> None:
+        """Roll back a failed operation, or mark the enclosing ``batch`` as failed.
+
+        Args:
+            db (AsyncSession): Database session
+        """
+        if db.info.get(_BATCH_KEY):
+            db.info[_BATCH_FAILED_KEY] = True
+        else:
+            await db.rollback()
+
+    @staticmethod
+    @asynccontextmanager
+    async def batch(db: AsyncSession) -> AsyncIterator[AsyncSession]:
+        """Run several CRUD operations in one transaction with a single commit.
+
+        Operations inside the block only flush their changes; the session
+        is committed once when the block exits and rolled back if it raises.
+        A failed operation does not roll back on its own: it marks the batch
+        as failed, and the batch is rolled back on exit even if the caller
+        caught the error. Nested blocks join the outermost one.
+
+        Args:
+            db (AsyncSession): Database session
+
+        Yields:
+            AsyncSession: The same database session
+
         Raises:
-            NotImplementedError: If not implemented by child class
+            CRUDException: If an operation inside the block failed and its
+                error was caught
+
+        Example:
+            async with task_crud.batch(db):
+                await task_crud.create(db, first)
+                await task_crud.create(db, second)
         """
-        raise NotImplemented
+        if db.info.get(_BATCH_KEY):
+            yield db
+            return
+        db.info[_BATCH_KEY] = True
+        try:
+            yield db
+            if db.info.get(_BATCH_FAILED_KEY):
+                raise CRUDException("Batch aborted: an operation inside it failed")
+            await db.commit()
+        except BaseException:
+            await db.rollback()
+            raise
+        finally:
+            del db.info[_BATCH_KEY]
+            db.info.pop(_BATCH_FAILED_KEY, None)
+
+    def _with_options(
+            self,
+            stmt: Select,
+            options: Optional[Sequence[ExecutableOption]],
+    ) -> Select:
+        """Apply loader options to a prebuilt statement.
+
+        Args:
+            stmt (Select): Prebuilt statement
+            options (Optional[Sequence[ExecutableOption]]): Loader options;
+                ``loader_options`` is used when None
+
+        Returns:
+            Select: Statement with the options applied, or the prebuilt
+            statement itself when there are none
+        """
+        if options is None:
+            options = self.loader_options
+        return stmt.options(*options) if options else stmt
+
+    def _values(self, obj_in: Union[BaseModel, Dict[str, Any]]) -> Dict[str, Any]:
+        """Extract column values from input data.
+
+        Only fields explicitly set on a schema (or present in a dict) that
+        match a model column are kept.
+
+        Args:
+            obj_in (Union[BaseModel, Dict[str, Any]]): Input schema or dict
+
+        Returns:
+            Dict[str, Any]: Column values keyed by column name
+        """
+        if isinstance(obj_in, dict):
+            return {field: obj_in[field] for field in obj_in.keys() & self._column_names}
+        return {
+            field: getattr(obj_in, field)
+            for field in obj_in.model_fields_set & self._column_names
+        }
 
     async def get(
             self,
@@ -51,6 +269,9 @@ class BaseCRUD(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     ) -> Optional[ModelType]:
         """Retrieve a single record by ID.
 
+        The session's identity map is checked first, so a record already
+        loaded in this session is returned without a query.
+
         Args:
             db (AsyncSession): Database session
             id (Any): Record ID to retrieve
@@ -58,15 +279,14 @@ class BaseCRUD(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             Optional[ModelType]: Retrieved record or None if not found
         """
-        logger.debug(f"Fetching {self.model.__name__} with ID={id}")
+        logger.debug("Fetching %s with ID=%s", self._model_name, id)
         try:
-            result = await db.execute(select(self.model).filter(self.model.id == id))
-            instance = result.scalars().first()
+            instance = await db.get(self.model, id)
             if not instance:
-                logger.warning(f"{self.model.__name__} with ID={id} not found")
+                logger.warning("%s with ID=%s not found", self._model_name, id)
             return instance
         except SQLAlchemyError as e:
-            logger.exception(f"Error fetching {self.model.__name__} with ID={id}")
+            logger.exception("Error fetching %s with ID=%s", self._model_name, id)
             raise CRUDException from e
 
     async def get_many(
@@ -74,6 +294,7 @@ class BaseCRUD(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             db: AsyncSession,
             skip: int = 0,
             limit: int = 100,
+            options: Optional[Sequence[ExecutableOption]] = None,
     ) -> List[ModelType]:
         """Retrieve multiple records with pagination.
 
@@ -81,20 +302,63 @@ class BaseCRUD(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             db (AsyncSession): Database session
             skip (int): Number of records to skip
             limit (int): Maximum number of records to return
+            options (Optional[Sequence[ExecutableOption]]): Loader options;
+                ``loader_options`` is used when omitted
 
         Returns:
             List[ModelType]: List of retrieved records
         """
-        logger.debug(f"Fetching many {self.model.__name__} (skip={skip}, limit={limit})")
+        logger.debug("Fetching many %s (skip=%s, limit=%s)", self._model_name, skip, limit)
         try:
             result = await db.execute(
-                select(self.model).offset(skip).limit(limit)
+                self._with_options(self._get_many_stmt, options),
+                {"skip_": skip, "limit_": limit},
             )
             items = result.scalars().all()
-            logger.info(f"Fetched {len(items)} {self.model.__name__}(s)")
+            logger.info("Fetched %s %s(s)", len(items), self._model_name)
             return items
         except SQLAlchemyError as e:
-            logger.exception(f"Error fetching list of {self.model.__name__}")
+            logger.exception("Error fetching list of %s", self._model_name)
+            raise CRUDException from e
+
+    async def iter_many(
+            self,
+            db: AsyncSession,
+            skip: int = 0,
+            limit: int = 100,
+            options: Optional[Sequence[ExecutableOption]] = None,
+            chunk: Optional[int] = None,
+    ) -> AsyncIterator[ModelType]:
+        """Stream multiple records with pagination.
+
+        Unlike ``get_many``, rows are fetched through a server-side cursor
+        in batches of ``chunk`` rows and yielded one at a time instead of
+        being collected into a list, so memory stays bounded by the batch
+        size. Lazy loading is disabled on streamed rows.
+
+        Args:
+            db (AsyncSession): Database session
+            skip (int): Number of records to skip
+            limit (int): Maximum number of records to return
+            options (Optional[Sequence[ExecutableOption]]): Loader options;
+                ``loader_options`` is used when omitted
+            chunk (Optional[int]): Rows fetched per round-trip;
+                ``stream_yield_per`` is used when omitted
+
+        Yields:
+            ModelType: Retrieved records
+        """
+        logger.debug("Streaming many %s (skip=%s, limit=%s)", self._model_name, skip, limit)
+        try:
+            result = await db.stream_scalars(
+                self._with_options(self._iter_many_stmt, options),
+                {"skip_": skip, "limit_": limit},
+                execution_options={"yield_per": chunk or self.stream_yield_per},
+            )
+            async for item in result:
+                yield item
+        except (SQLAlchemyError, PostgresError) as e:
+            logger.exception("Error streaming list of %s", self._model_name)
             raise CRUDException from e
 
     async def create(
@@ -102,7 +366,7 @@ class BaseCRUD(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             db: AsyncSession,
             obj_in: Union[CreateSchemaType, Dict[str, Any]]
     ) -> ModelType:
-        """Create a new record.
+        """Create a new record with a single INSERT ... RETURNING statement.
 
         Args:
             db (AsyncSession): Database session
@@ -114,23 +378,130 @@ class BaseCRUD(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Note:
             Returns None if no data is provided for creation
         """
-        logger.debug(f"Creating new {self.model.__name__}")
+        logger.debug("Creating new %s", self._model_name)
         try:
-            create_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+            create_data = self._values(obj_in)
             if not create_data:
                 logger.warning("Create failed: no input data")
                 raise CreateError("No data provided for creation")
 
-            db_obj = self.model(**create_data)
-            db.add(db_obj)
-            await db.commit()
-            await db.refresh(db_obj)
+            result = await db.execute(
+                sqlalchemy_insert(self.model).values(**create_data).returning(self.model)
+            )
+            db_obj = result.scalar_one()
+            await self._commit(db)
 
-            logger.info(f"Created {self.model.__name__} with ID={db_obj.id}")
+            logger.info("Created %s with ID=%s", self._model_name, db_obj.id)
             return db_obj
         except SQLAlchemyError as e:
-            await db.rollback()
-            logger.exception(f"Error creating {self.model.__name__}")
+            await self._rollback(db)
+            logger.exception("Error creating %s", self._model_name)
+            raise CreateError from e
+
+    async def bulk_create(
+            self,
+            db: AsyncSession,
+            objs_in: List[Union[CreateSchemaType, Dict[str, Any]]],
+    ) -> List[ModelType]:
+        """Create several records in one statement and one commit.
+
+        Args:
+            db (AsyncSession): Database session
+            objs_in (List[Union[CreateSchemaType, Dict[str, Any]]]): Data for new records
+
+        Returns:
+            List[ModelType]: Created records in input order
+
+        Raises:
+            CreateError: If no data is provided or the insert fails
+        """
+        logger.debug("Bulk creating %s %s(s)", len(objs_in), self._model_name)
+        try:
+            rows = [self._values(obj_in) for obj_in in objs_in]
+            if not rows or not all(rows):
+                logger.warning("Bulk create failed: no input data")
+                raise CreateError("No data provided for creation")
+
+            result = await db.scalars(
+                sqlalchemy_insert(self.model).returning(self.model, sort_by_parameter_order=True),
+                rows,
+            )
+            created = result.all()
+            await self._commit(db)
+
+            logger.info("Created %s %s(s)", len(created), self._model_name)
+            return created
+        except SQLAlchemyError as e:
+            await self._rollback(db)
+            logger.exception("Error bulk creating %s", self._model_name)
+            raise CreateError from e
+
+    async def create_many(
+            self,
+            db: AsyncSession,
+            objs_in: List[Union[CreateSchemaType, Dict[str, Any]]],
+    ) -> int:
+        """Load many records without returning them.
+
+        Batches of at least ``copy_threshold`` rows are pushed with asyncpg's
+        ``copy_records_to_table`` in a single COPY; smaller batches use a
+        multi-row INSERT. Python-side scalar and callable column defaults
+        are filled in before COPY, since it bypasses SQLAlchemy. Columns
+        with server-side, sequence or SQL expression defaults are left out
+        of the COPY unless provided, so PostgreSQL fills them in.
+
+        Args:
+            db (AsyncSession): Database session
+            objs_in (List[Union[CreateSchemaType, Dict[str, Any]]]): Data for new records
+
+        Returns:
+            int: Number of created records
+
+        Raises:
+            CreateError: If no data is provided or the load fails
+        """
+        logger.debug("Loading %s %s(s)", len(objs_in), self._model_name)
+        try:
+            rows = [self._values(obj_in) for obj_in in objs_in]
+            if not rows or not all(rows):
+                logger.warning("Create many failed: no input data")
+                raise CreateError("No data provided for creation")
+
+            if len(rows) < self.copy_threshold:
+                await db.execute(sqlalchemy_insert(self.model), rows)
+            else:
+                provided = set().union(*rows)
+                columns = [
+                    name for name in self.model.__table__.columns.keys()
+                    if name in provided or name in self._copy_defaults
+                ]
+                defaults = self._copy_defaults
+                records = [
+                    tuple(
+                        row.get(name) if name in row or name not in defaults else defaults[name]()
+                        for name in columns
+                    )
+                    for row in rows
+                ]
+                connection = await db.connection()
+                raw_connection = await connection.get_raw_connection()
+                adapted_connection = raw_connection.dbapi_connection
+                if not adapted_connection._started:
+                    # The asyncpg adapter sends BEGIN lazily with the first
+                    # statement it runs itself, and session.connection() does
+                    # not run one; without a transaction COPY would commit on
+                    # its own regardless of the session
+                    await adapted_connection._start_transaction()
+                await raw_connection.driver_connection.copy_records_to_table(
+                    self.model.__tablename__, records=records, columns=columns,
+                )
+            await self._commit(db)
+
+            logger.info("Created %s %s(s)", len(rows), self._model_name)
+            return len(rows)
+        except (SQLAlchemyError, PostgresError) as e:
+            await self._rollback(db)
+            logger.exception("Error loading %s", self._model_name)
             raise CreateError from e
 
     async def update(
@@ -150,40 +521,86 @@ class BaseCRUD(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             ModelType: Updated record
 
         Note:
-            Returns original object if no update data is provided
+            Returns original object if no update data is provided.
+            The fields are set on the loaded object and written by the
+            unit-of-work flush on commit. Sessions are created with
+            ``expire_on_commit=False``, so no refresh SELECT is needed
+            afterwards. Use ``update_by_id`` when the record is not loaded.
         """
-        logger.debug(f"Updating {self.model.__name__} ID={db_obj.id}")
+        logger.debug("Updating %s ID=%s", self._model_name, db_obj.id)
         try:
-            update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+            update_data = self._values(obj_in)
 
             if not update_data:
                 logger.info("Update skipped: no fields to update")
                 return db_obj
 
-            for field in update_data:
-                if hasattr(db_obj, field):
-                    setattr(db_obj, field, update_data[field])
-
-            await db.execute(
-                sqlalchemy_update(self.model)
-                .where(self.model.id == db_obj.id)
-                .values(**update_data)
-            )
-            await db.commit()
-            await db.refresh(db_obj)
+            for field, value in update_data.items():
+                setattr(db_obj, field, value)
+            await self._commit(db)
 
-            logger.info(f"Updated {self.model.__name__} ID={db_obj.id}")
+            logger.info("Updated %s ID=%s", self._model_name, db_obj.id)
             return db_obj
         except SQLAlchemyError as e:
-            await db.rollback()
-            logger.exception(f"Error updating {self.model.__name__} ID={db_obj.id}")
+            await self._rollback(db)
+            logger.exception("Error updating %s ID=%s", self._model_name, db_obj.id)
+            raise UpdateError from e
+
+    async def update_by_id(
+            self,
+            db: AsyncSession,
+            id: Any,
+            obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> ModelType:
+        """Update a record by ID with a single UPDATE ... RETURNING statement.
+
+        Args:
+            db (AsyncSession): Database session
+            id (Any): ID of record to update
+            obj_in (Union[UpdateSchemaType, Dict[str, Any]]): Update data
+
+        Returns:
+            ModelType: Updated record
+
+        Note:
+            When no update data is provided, the record is fetched and
+            returned unchanged
+
+        Raises:
+            NotFoundError: If no record with the given ID exists
+        """
+        logger.debug("Updating %s ID=%s", self._model_name, id)
+        try:
+            update_data = self._values(obj_in)
+
+            if not update_data:
+                logger.info("Update skipped: no fields to update")
+                db_obj = await self.get(db, id=id)
+                if db_obj is None:
+                    raise NotFoundError(f"{self._model_name} with ID {id} not found")
+                return db_obj
+
+            result = await db.execute(
+                self._update_stmt.values(**update_data), {"id_": id}
+            )
+            updated = result.scalar_one_or_none()
+            if updated is None:
+                logger.warning("Update failed: %s ID=%s not found", self._model_name, id)
+                raise NotFoundError(f"{self._model_name} with ID {id} not found")
+            await self._commit(db)
+
+            logger.info("Updated %s ID=%s", self._model_name, updated.id)
+            return updated
+        except SQLAlchemyError as e:
+            await self._rollback(db)
+            logger.exception("Error updating %s ID=%s", self._model_name, id)
             raise UpdateError from e
 
     async def delete(
             self,
             db: AsyncSession,
             id: int,
-    ) -> Optional[ModelType]:
+    ) -> ModelType:
         """Delete a record by ID.
 
         Args:
@@ -191,21 +608,50 @@ class BaseCRUD(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             id (int): ID of record to delete
 
         Returns:
-            Optional[ModelType]: Deleted record or None if not found
+            ModelType: Deleted record
+
+        Raises:
+            NotFoundError: If no record with the given ID exists
         """
-        logger.debug(f"Deleting {self.model.__name__} ID={id}")
+        logger.debug("Deleting %s ID=%s", self._model_name, id)
         try:
-            obj = await self.get(db, id=id)
-            if not obj:
-                logger.warning(f"Delete failed: {self.model.__name__} ID={id} not found")
-                raise NotFoundError(f"{self.model.__name__} with ID {id} not found")
+            result = await db.execute(self._delete_stmt, {"id_": id})
+            obj = result.scalar_one_or_none()
+            if obj is None:
+                logger.warning("Delete failed: %s ID=%s not found", self._model_name, id)
+                raise NotFoundError(f"{self._model_name} with ID {id} not found")
+            await self._commit(db)
+
+            logger.info("Deleted %s ID=%s", self._model_name, id)
+            return obj
+        except SQLAlchemyError as e:
+            await self._rollback(db)
+            logger.exception("Error deleting %s ID=%s", self._model_name, id)
+            raise DeleteError from e
 
-            await db.execute(sqlalchemy_delete(self.model).where(self.model.id == id))
-            await db.commit()
+    async def bulk_delete(
+            self,
+            db: AsyncSession,
+            ids: List[int],
+    ) -> List[ModelType]:
+        """Delete several records by ID in one statement and one commit.
 
-            logger.info(f"Deleted {self.model.__name__} ID={id}")
-            return obj
+        Args:
+            db (AsyncSession): Database session
+            ids (List[int]): IDs of records to delete
+
+        Returns:
+            List[ModelType]: Deleted records; IDs that do not exist are skipped
+        """
+        logger.debug("Bulk deleting %s IDs=%s", self._model_name, ids)
+        try:
+            result = await db.scalars(self._bulk_delete_stmt, {"ids_": ids})
+            deleted = result.all()
+            await self._commit(db)
+
+            logger.info("Deleted %s %s(s)", len(deleted), self._model_name)
+            return deleted
         except SQLAlchemyError as e:
-            await db.rollback()
-            logger.exception(f"Error deleting {self.model.__name__} ID={id}")
+            await self._rollback(db)
+            logger.exception("Error bulk deleting %s IDs=%s", self._model_name, ids)
             raise DeleteError from e
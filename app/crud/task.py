@@ -1,5 +1,7 @@
 """Task CRUD operations module."""
 
+from __future__ import annotations
+
 from app.crud.base import BaseCRUD
 from app.models.task import Task
 from app.schemas.task import TaskCreate, TaskUpdate
@@ -1,9 +1,12 @@
 """Dependencies module."""
 
+from __future__ import annotations
+
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.infrastructure.cache import ResponseCache
 from app.infrastructure.config import settings
 from app.infrastructure.db_connection import DbConnection
 from app.crud import TaskCRUD
@@ -14,9 +17,24 @@ db_connection = DbConnection(
     echo=settings.db.echo,
     echo_pool=settings.db.echo_pool,
     pool_size=settings.db.pool_size,
-    max_overflow=settings.db.max_overflow
+    max_overflow=settings.db.max_overflow,
+    pool_timeout=settings.db.pool_timeout,
+    pool_recycle=settings.db.pool_recycle,
+    pool_pre_ping=settings.db.pool_pre_ping,
+    prepared_statement_cache_size=settings.db.prepared_statement_cache_size,
+    statement_cache_size=settings.db.statement_cache_size,
+    query_cache_size=settings.db.query_cache_size,
+)
+
+# Initialize response cache with settings from config
+response_cache = ResponseCache(
+    url=settings.cache.url,
+    enabled=settings.cache.enabled,
 )
 
+# CRUD handlers are stateless, so a single instance serves every request
+task_crud = TaskCRUD()
+
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Get database session dependency.
@@ -30,17 +48,46 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     Note:
         The session is automatically closed after use
     """
-    async for session in db_connection.session_getter():
+    async with db_connection.session_factory() as session:
         yield session
 
 
+async def get_stream_db_session() -> AsyncSession:
+    """Get database session dependency for streaming responses.
+
+    FastAPI finalizes yield dependencies before a streaming body is sent,
+    which would close a session from ``get_db_session`` while the stream
+    still reads from its cursor. This session is left open instead.
+
+    Returns:
+        AsyncSession: SQLAlchemy async session
+
+    Note:
+        The caller owns the session and must close it, normally when the
+        stream is finished
+    """
+    return db_connection.session_factory()
+
+
 async def get_task_crud() -> TaskCRUD:
     """Get TaskCRUD instance dependency.
     
-    This function provides a TaskCRUD instance for task operations.
+    This function provides the shared TaskCRUD instance for task operations.
     It's used as a FastAPI dependency for task-related endpoints.
     
     Returns:
         TaskCRUD: Task CRUD operations handler
     """
-    return TaskCRUD()
+    return task_crud
+
+
+async def get_response_cache() -> ResponseCache:
+    """Get ResponseCache instance dependency.
+
+    This function provides the shared response cache for read endpoints
+    and for invalidation on writes.
+
+    Returns:
+        ResponseCache: Redis-backed response cache
+    """
+    return response_cache
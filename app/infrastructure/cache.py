@@ -0,0 +1,87 @@
+"""Response cache module."""
+
+from typing import Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.infrastructure.logger import logger
+
+
+class ResponseCache:
+    """Redis-backed cache for serialized API responses.
+
+    The cache stores ready-to-send response bodies, so a hit is returned
+    without touching the database or re-encoding anything. Redis failures
+    are logged and treated as cache misses, so the API keeps working when
+    Redis is unavailable.
+
+    Attributes:
+        enabled (bool): Whether caching is active
+        redis (Redis | None): Redis client, or None when caching is disabled
+    """
+
+    def __init__(self, url: str, enabled: bool = True) -> None:
+        """Initialize response cache.
+
+        Args:
+            url (str): Redis connection URL
+            enabled (bool): Enable caching; when False every call is a no-op
+        """
+        self.enabled = enabled
+        self.redis: Optional[Redis] = Redis.from_url(url) if enabled else None
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a cached response body.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Optional[bytes]: Cached body or None on a miss
+        """
+        if not self.enabled:
+            return None
+        try:
+            return await self.redis.get(key)
+        except RedisError:
+            logger.warning("Cache read failed for key=%s", key, exc_info=True)
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Store a response body.
+
+        Args:
+            key (str): Cache key
+            value (bytes): Serialized response body
+            ttl (int): Expiration time in seconds
+        """
+        if not self.enabled:
+            return
+        try:
+            await self.redis.set(key, value, ex=ttl)
+        except RedisError:
+            logger.warning("Cache write failed for key=%s", key, exc_info=True)
+
+    async def invalidate(self, *keys: str, pattern: Optional[str] = None) -> None:
+        """Remove cached entries.
+
+        Args:
+            *keys (str): Exact keys to remove
+            pattern (Optional[str]): Glob pattern of additional keys to remove
+        """
+        if not self.enabled:
+            return
+        try:
+            to_delete = list(keys)
+            if pattern is not None:
+                to_delete.extend([key async for key in self.redis.scan_iter(match=pattern)])
+            if to_delete:
+                await self.redis.unlink(*to_delete)
+        except RedisError:
+            logger.warning("Cache invalidation failed for keys=%s pattern=%s", keys, pattern, exc_info=True)
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        if self.redis is not None:
+            await self.redis.aclose()
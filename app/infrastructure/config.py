@@ -1,6 +1,8 @@
 """Configuration module."""
 
 import pathlib
+from functools import cached_property, lru_cache
+from typing import Any
 
 from pydantic import BaseModel, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -56,10 +58,14 @@ class AuthConfig(BaseModel):
         secret_key (str): Secret key for JWT token signing
         algorithm (str): Algorithm used for JWT token signing
         access_token_expire_min (int): Token expiration time in minutes
+        token_cache_size (int): Maximum number of decoded tokens kept in cache
+        token_cache_ttl (int): Lifetime of a cached decoded token in seconds
     """
     secret_key: str = None
     algorithm: str = None
     access_token_expire_min: int = None
+    token_cache_size: int = 10_000
+    token_cache_ttl: int = 60
 
 
 class DatabaseConfig(BaseModel):
@@ -77,6 +83,13 @@ class DatabaseConfig(BaseModel):
         echo_pool (bool): Enable connection pool logging
         pool_size (int): Size of the connection pool
         max_overflow (int): Maximum number of connections that can be created beyond the pool size
+        pool_timeout (int): Seconds to wait for a free connection from the pool
+        pool_recycle (int): Seconds after which a pooled connection is replaced
+        pool_pre_ping (bool): Check connection liveness on checkout
+        prepared_statement_cache_size (int): Prepared statements cached per
+            connection by SQLAlchemy's asyncpg dialect (0 disables the cache)
+        statement_cache_size (int): Size of asyncpg's own statement cache
+        query_cache_size (int): Size of SQLAlchemy's compiled statement cache
     """
     host: str = None
     port: str = None
@@ -85,13 +98,21 @@ class DatabaseConfig(BaseModel):
     password: str = None
     echo: bool = False
     echo_pool: bool = False
-    pool_size: int = 5
+    pool_size: int = 20
     max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = False
+    prepared_statement_cache_size: int = 1000
+    statement_cache_size: int = 1000
+    query_cache_size: int = 1200
 
     @computed_field
-    @property
+    @cached_property
     def dsn(self) -> str:
         """Get database connection string.
+
+        The value is built once per config instance and then reused.
         
         Returns:
             str: PostgreSQL connection string with asyncpg driver
@@ -99,6 +120,23 @@ class DatabaseConfig(BaseModel):
         return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
 
 
+class CacheConfig(BaseModel):
+    """Response cache configuration.
+
+    This class defines settings for the Redis-backed cache of read endpoints.
+
+    Attributes:
+        enabled (bool): Enable response caching
+        url (str): Redis connection URL
+        task_ttl (int): Lifetime of a cached single task response in seconds
+        task_list_ttl (int): Lifetime of a cached task list response in seconds
+    """
+    enabled: bool = False
+    url: str = "redis://localhost:6379/0"
+    task_ttl: int = 30
+    task_list_ttl: int = 5
+
+
 class Settings(BaseSettings):
     """Application settings.
     
@@ -110,6 +148,7 @@ class Settings(BaseSettings):
         api_prefix (ApiPrefixConfig): API prefix configuration
         auth (AuthConfig): Authentication configuration
         db (DatabaseConfig): Database configuration
+        cache (CacheConfig): Response cache configuration
     """
     model_config = SettingsConfigDict(
         case_sensitive=False,
@@ -121,7 +160,40 @@ class Settings(BaseSettings):
     api_prefix: ApiPrefixConfig = ApiPrefixConfig()
     auth: AuthConfig = AuthConfig()
     db: DatabaseConfig = DatabaseConfig()
+    cache: CacheConfig = CacheConfig()
     logger: LoggerConfig = LoggerConfig()
 
 
-settings = Settings(_env_file=ENV_FILEPATH)
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get application settings.
+
+    Settings are read from the environment and the .env file once and
+    reused by every later call.
+
+    Returns:
+        Settings: Application settings
+    """
+    return Settings(_env_file=ENV_FILEPATH)
+
+
+def __getattr__(name: str) -> Any:
+    """Create the module-level ``settings`` on first access.
+
+    Reading the environment and the .env file is deferred until something
+    imports ``settings``; the result is then stored as a regular module
+    attribute so later lookups bypass this hook.
+
+    Args:
+        name (str): Requested module attribute
+
+    Returns:
+        Any: Application settings when ``name`` is ``settings``
+
+    Raises:
+        AttributeError: For any other attribute
+    """
+    if name == "settings":
+        globals()["settings"] = get_settings()
+        return globals()["settings"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,5 @@
 """Database connection module."""
 
-from typing import AsyncGenerator
-
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncEngine,
@@ -14,8 +12,8 @@ class DbConnection:
     """Database connection manager.
     
     This class manages database connections using SQLAlchemy's async engine
-    and session factory. It provides methods for session creation and
-    connection disposal.
+    and session factory. It provides the session factory and connection
+    disposal.
     
     Attributes:
         engine (AsyncEngine): SQLAlchemy async engine instance
@@ -27,8 +25,14 @@ class DbConnection:
         url: str,
         echo: bool = False,
         echo_pool: bool = False,
-        pool_size: int = 5,
+        pool_size: int = 20,
         max_overflow: int = 10,
+        pool_timeout: int = 30,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = False,
+        prepared_statement_cache_size: int = 1000,
+        statement_cache_size: int = 1000,
+        query_cache_size: int = 1200,
     ) -> None:
         """Initialize database connection manager.
         
@@ -39,6 +43,13 @@ class DbConnection:
             pool_size (int): Size of the connection pool
             max_overflow (int): Maximum number of connections that can be created
                               beyond the pool size
+            pool_timeout (int): Seconds to wait for a free connection from the pool
+            pool_recycle (int): Seconds after which a pooled connection is replaced
+            pool_pre_ping (bool): Check connection liveness on checkout
+            prepared_statement_cache_size (int): Prepared statements cached per
+                                                 connection by the asyncpg dialect
+            statement_cache_size (int): Size of asyncpg's own statement cache
+            query_cache_size (int): Size of SQLAlchemy's compiled statement cache
         """
         self.engine: AsyncEngine = create_async_engine(
             url=url,
@@ -46,6 +57,14 @@ class DbConnection:
             echo_pool=echo_pool,
             pool_size=pool_size,
             max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            query_cache_size=query_cache_size,
+            connect_args={
+                "prepared_statement_cache_size": prepared_statement_cache_size,
+                "statement_cache_size": statement_cache_size,
+            },
         )
         self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
             bind=self.engine,
@@ -58,11 +77,3 @@ class DbConnection:
         """Dispose of the database engine and close all connections."""
         await self.engine.dispose()
 
-    async def session_getter(self) -> AsyncGenerator[AsyncSession, None]:
-        """Get a database session.
-        
-        Yields:
-            AsyncSession: SQLAlchemy async session
-        """
-        async with self.session_factory() as session:
-            yield session
@@ -3,17 +3,21 @@
 from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
 
 from app.api.api_v1 import router
-from app.dependencies import db_connection
+from app.crud.exeptions import CRUDException, NotFoundError
+from app.dependencies import db_connection, response_cache
 from app.infrastructure.config import settings
+from app.infrastructure.logger import logger
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     yield
+    await response_cache.close()
     await db_connection.dispose()
 
 
@@ -22,10 +26,34 @@ main_app = FastAPI(
     description="API for managing scheduled tasks for notifications.",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 main_app.include_router(router, prefix=settings.api_prefix.api)
 
+
+@main_app.exception_handler(NotFoundError)
+async def not_found_error_handler(request: Request, exc: NotFoundError) -> ORJSONResponse:
+    """Translate a missing object into a 404 response."""
+    logger.warning("NotFoundError: %s", exc)
+    return ORJSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={"detail": str(exc)},
+    )
+
+
+@main_app.exception_handler(CRUDException)
+async def crud_exception_handler(request: Request, exc: CRUDException) -> ORJSONResponse:
+    """Translate any other CRUD failure into a 500 response."""
+    logger.error(
+        "Unhandled CRUDException on %s %s", request.method, request.url.path,
+        exc_info=exc,
+    )
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Internal server error"},
+    )
+
 if __name__ == '__main__':
     uvicorn.run(
         main_app,
@@ -1,25 +1,21 @@
 """Task model module."""
 
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import String, DateTime, Integer
+from sqlalchemy import String, DateTime, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
 
 
-def utc_now() -> datetime:
-    """Get current UTC datetime.
-    
-    Returns:
-        datetime: Current datetime in UTC timezone
-    """
-    return datetime.now(timezone.utc)
-
-
 class Task(Base):
-    """Task model for storing task information."""
+    """Task model for storing task information.
+
+    Timestamps are set by PostgreSQL with ``now()`` and read back through
+    ``RETURNING`` on insert and update.
+    """
     __tablename__ = "tasks"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(
         Integer(),
@@ -27,12 +23,12 @@ class Task(Base):
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=utc_now,
+        server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=utc_now,
-        onupdate=utc_now,
+        server_default=func.now(),
+        onupdate=func.now(),
     )
     datetime_to_do: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     task_info: Mapped[str] = mapped_column(String(1024))
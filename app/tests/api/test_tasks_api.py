@@ -1,14 +1,23 @@
 """Task API test module."""
 
+import contextlib
 from datetime import datetime, timezone, timedelta
+from typing import AsyncGenerator
 
 import pytest
+from fakeredis import FakeAsyncRedis
 from fastapi import status
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud.exeptions import CRUDException, CreateError
 from app.crud.task import TaskCRUD
+from app.dependencies import get_db_session
+from app.infrastructure.cache import ResponseCache
 from app.infrastructure.config import settings
+from app.main import main_app
+from app.schemas.task import TaskCreate
+from app.tests.utils import ASGIShim
 
 PREFIX = settings.api_prefix.api + settings.api_prefix.tasks
 task_crud = TaskCRUD()
@@ -69,15 +78,15 @@ async def test_create_task(
 
 @pytest.mark.asyncio
 async def test_get_task_list(
-        async_client: AsyncClient, test_tasks: list[dict],
+        fast_client: ASGIShim, seeded_tasks: list[dict],
 ):
     """Test get list of tasks."""
-    response = await async_client.get(f"{PREFIX}/list")
+    response = await fast_client.call(f"{PREFIX}/list")
     assert response.status_code == status.HTTP_200_OK
     tasks = response.json()
     assert len(tasks) == 2
-    assert tasks[0]["task_info"] == test_tasks[0]["task_info"]
-    assert tasks[1]["task_info"] == test_tasks[1]["task_info"]
+    assert tasks[0]["task_info"] == seeded_tasks[0]["task_info"]
+    assert tasks[1]["task_info"] == seeded_tasks[1]["task_info"]
 
 
 @pytest.mark.parametrize(
@@ -89,7 +98,7 @@ async def test_get_task_list(
 )
 @pytest.mark.asyncio
 async def test_get_single_task(
-        async_client: AsyncClient, test_tasks: list[dict],
+        async_client: AsyncClient, seeded_tasks: list[dict],
         task_id, status_code,
 ):
     """Test get task by id."""
@@ -101,7 +110,7 @@ async def test_get_single_task(
 
     fetched_task = response.json()
     assert fetched_task["id"] == task_id
-    assert fetched_task["task_info"] == test_tasks[task_id - 1]["task_info"]
+    assert fetched_task["task_info"] == seeded_tasks[task_id - 1]["task_info"]
 
 
 @pytest.mark.parametrize(
@@ -113,7 +122,7 @@ async def test_get_single_task(
 )
 @pytest.mark.asyncio
 async def test_update_task(
-        async_client: AsyncClient, test_tasks: list[dict],
+        async_client: AsyncClient, seeded_tasks: list[dict],
         task_id, update_data, status_code
 ):
     """Test task update."""
@@ -131,24 +140,280 @@ async def test_update_task(
 @pytest.mark.parametrize(
     "task_id, status_code",
     [
-        [1, status.HTTP_200_OK],
+        [1, status.HTTP_204_NO_CONTENT],
         [3, status.HTTP_404_NOT_FOUND],
     ]
 )
 @pytest.mark.asyncio
 async def test_delete_task(
-        async_client: AsyncClient, test_tasks: list[dict],
+        async_client: AsyncClient, seeded_tasks: list[dict],
         task_id, status_code,
 ):
     """Test task delete."""
     response = await async_client.delete(f"{PREFIX}/{task_id}")
 
     assert response.status_code == status_code
-    if status_code != status.HTTP_200_OK:
+    if status_code != status.HTTP_204_NO_CONTENT:
         return
 
-    deleted_task_response = response.json()
-    assert deleted_task_response["id"] == task_id
+    assert response.content == b""
 
     get_response = await async_client.get(f"{PREFIX}/{task_id}")
     assert get_response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.parametrize(
+    "tasks_data, status_code",
+    [
+        [
+            [
+                {
+                    "datetime_to_do": (datetime.now(timezone.utc) + timedelta(days=1)).isoformat(),
+                    "task_info": "Bulk task 1",
+                },
+                {
+                    "datetime_to_do": (datetime.now(timezone.utc) + timedelta(days=2)).isoformat(),
+                    "task_info": "Bulk task 2",
+                },
+            ],
+            status.HTTP_201_CREATED,
+        ],
+        [
+            [
+                {
+                    "datetime_to_do": "not-a-datetime",
+                    "task_info": "Bulk task with invalid datetime",
+                },
+            ],
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+        ],
+        [[], status.HTTP_422_UNPROCESSABLE_ENTITY],
+    ]
+)
+@pytest.mark.asyncio
+async def test_bulk_create_tasks(
+        async_client: AsyncClient, db_session: AsyncSession,
+        tasks_data, status_code,
+):
+    """Test bulk task creation."""
+    response = await async_client.post(f"{PREFIX}/bulk", json=tasks_data)
+    assert response.status_code == status_code
+    if status_code != status.HTTP_201_CREATED:
+        return
+
+    created_tasks = response.json()
+    assert [task["task_info"] for task in created_tasks] == [task["task_info"] for task in tasks_data]
+
+    for created_task in created_tasks:
+        db_task_obj = await task_crud.get(db=db_session, id=created_task["id"])
+        assert db_task_obj is not None
+        assert db_task_obj.task_info == created_task["task_info"]
+
+
+@pytest.mark.parametrize(
+    "task_ids, deleted_ids",
+    [
+        [[1, 2], [1, 2]],
+        [[1, 3], [1]],
+    ]
+)
+@pytest.mark.asyncio
+async def test_bulk_delete_tasks(
+        async_client: AsyncClient, seeded_tasks: list[dict],
+        task_ids, deleted_ids,
+):
+    """Test bulk task delete."""
+    response = await async_client.delete(f"{PREFIX}/bulk", params={"ids": task_ids})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert sorted(task["id"] for task in response.json()) == deleted_ids
+
+    for task_id in deleted_ids:
+        get_response = await async_client.get(f"{PREFIX}/{task_id}")
+        assert get_response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.parametrize("count", [3, 150])
+@pytest.mark.asyncio
+async def test_create_many_tasks(async_client: AsyncClient, db_session: AsyncSession, count):
+    """Test loading tasks with both the INSERT and the COPY path."""
+    tasks_data = [
+        TaskCreate(
+            datetime_to_do=datetime.now(timezone.utc) + timedelta(days=1),
+            task_info=f"Loaded task {i}",
+        )
+        for i in range(count)
+    ]
+    created = await task_crud.create_many(db_session, tasks_data)
+    assert created == count
+
+    response = await async_client.get(f"{PREFIX}/list", params={"limit": 200})
+    assert response.status_code == status.HTTP_200_OK
+    tasks = response.json()
+    assert len(tasks) == count
+    assert all(task["created_at"] is not None for task in tasks)
+
+
+@pytest.mark.parametrize("fail", [False, True])
+@pytest.mark.asyncio
+async def test_batch_commits_once(async_client: AsyncClient, db_session: AsyncSession, fail):
+    """Test that a batch commits all operations together or none of them."""
+    task_data = {"datetime_to_do": datetime.now(timezone.utc), "task_info": "Batched task"}
+    with pytest.raises(RuntimeError) if fail else contextlib.nullcontext():
+        async with task_crud.batch(db_session):
+            await task_crud.create(db_session, task_data)
+            await task_crud.create(db_session, task_data)
+            if fail:
+                raise RuntimeError
+
+    response = await async_client.get(f"{PREFIX}/list")
+    assert len(response.json()) == (0 if fail else 2)
+
+
+@pytest.mark.asyncio
+async def test_write_syncs_loaded_objects(db_session: AsyncSession, seeded_tasks: list[dict]):
+    """Test that updates and deletes by ID refresh objects already loaded in the session."""
+    task = await task_crud.get(db_session, id=1)
+
+    updated = await task_crud.update_by_id(db_session, id=1, obj_in={"task_info": "Synced info"})
+    assert updated is task
+    assert task.task_info == "Synced info"
+
+    loaded = await task_crud.get(db_session, id=2)
+    assert loaded is not None
+    await task_crud.bulk_delete(db_session, ids=[2])
+    assert await task_crud.get(db_session, id=2) is None
+
+    await task_crud.delete(db_session, id=1)
+    assert await task_crud.get(db_session, id=1) is None
+
+
+@pytest.mark.asyncio
+async def test_create_many_copy_error(db_session: AsyncSession):
+    """Test that a failing COPY is reported as a CreateError."""
+    tasks_data = [
+        {"datetime_to_do": datetime.now(timezone.utc), "task_info": "x" * 2000}
+        for _ in range(task_crud.copy_threshold)
+    ]
+    with pytest.raises(CreateError):
+        await task_crud.create_many(db_session, tasks_data)
+
+
+@pytest.mark.asyncio
+async def test_batch_with_caught_error_rolls_back(async_client: AsyncClient, db_session: AsyncSession):
+    """Test that a batch is not committed partially after a caught operation error."""
+    task_data = {"datetime_to_do": datetime.now(timezone.utc), "task_info": "Batched task"}
+    with pytest.raises(CRUDException):
+        async with task_crud.batch(db_session):
+            await task_crud.create(db_session, task_data)
+            with pytest.raises(CreateError):
+                await task_crud.create(db_session, {**task_data, "task_info": "x" * 2000})
+
+    response = await async_client.get(f"{PREFIX}/list")
+    assert response.json() == []
+
+
+@pytest.mark.parametrize(
+    "params, status_code",
+    [
+        [{"limit": -1}, status.HTTP_422_UNPROCESSABLE_ENTITY],
+        [{"skip": -1}, status.HTTP_422_UNPROCESSABLE_ENTITY],
+        [{"limit": 1001}, status.HTTP_422_UNPROCESSABLE_ENTITY],
+        [{"skip": 2 ** 40}, status.HTTP_422_UNPROCESSABLE_ENTITY],
+    ]
+)
+@pytest.mark.asyncio
+async def test_get_task_list_errors(async_client: AsyncClient, params, status_code):
+    """Test that list errors are reported before the response starts streaming."""
+    response = await async_client.get(f"{PREFIX}/list", params=params)
+    assert response.status_code == status_code
+    assert "detail" in response.json()
+
+
+@pytest.mark.asyncio
+async def test_get_single_task_cached(
+        async_client: AsyncClient, db_session: AsyncSession, seeded_tasks: list[dict],
+        response_cache: ResponseCache,
+):
+    """Test that a single task is served from the cache until it is updated."""
+    response = await async_client.get(f"{PREFIX}/1")
+    assert response.status_code == status.HTTP_200_OK
+    assert await response_cache.get("tasks:1") == response.content
+
+    await task_crud.update_by_id(db_session, id=1, obj_in={"task_info": "Changed behind the cache"})
+    cached_response = await async_client.get(f"{PREFIX}/1")
+    assert cached_response.json()["task_info"] == seeded_tasks[0]["task_info"]
+
+    response = await async_client.patch(f"{PREFIX}/1/update", json={"task_info": "Updated info"})
+    assert response.status_code == status.HTTP_200_OK
+    assert await response_cache.get("tasks:1") is None
+
+    response = await async_client.get(f"{PREFIX}/1")
+    assert response.json()["task_info"] == "Updated info"
+
+
+@pytest.mark.asyncio
+async def test_get_task_list_cached(
+        async_client: AsyncClient, db_session: AsyncSession, seeded_tasks: list[dict],
+        response_cache: ResponseCache,
+):
+    """Test that task list pages are cached and invalidated by writes."""
+    response = await async_client.get(f"{PREFIX}/list", params={"limit": 10})
+    assert response.status_code == status.HTTP_200_OK
+    assert await response_cache.get("tasks:list:0:10") == response.content
+
+    await task_crud.delete(db_session, id=2)
+    cached_response = await async_client.get(f"{PREFIX}/list", params={"limit": 10})
+    assert len(cached_response.json()) == 2
+
+    task_data = {"datetime_to_do": datetime.now(timezone.utc).isoformat(), "task_info": "New task"}
+    response = await async_client.post(f"{PREFIX}/create", json=task_data)
+    assert response.status_code == status.HTTP_201_CREATED
+    assert await response_cache.get("tasks:list:0:10") is None
+
+    response = await async_client.get(f"{PREFIX}/list", params={"limit": 10})
+    assert [task["task_info"] for task in response.json()] == ["Test task 1", "New task"]
+
+
+@pytest.mark.asyncio
+async def test_cache_unavailable(
+        async_client: AsyncClient, seeded_tasks: list[dict], response_cache: ResponseCache,
+):
+    """Test that Redis failures are treated as cache misses."""
+    response_cache.redis = FakeAsyncRedis(connected=False)
+
+    response = await async_client.get(f"{PREFIX}/1")
+    assert response.status_code == status.HTTP_200_OK
+    response = await async_client.get(f"{PREFIX}/list")
+    assert len(response.json()) == 2
+    response = await async_client.delete(f"{PREFIX}/1")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.asyncio
+async def test_get_task_list_after_session_teardown(
+        async_client: AsyncClient, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that the list stream outlives the request's session dependency."""
+
+    async def yield_db_session() -> AsyncGenerator[AsyncSession, None]:
+        try:
+            yield db_session
+        finally:
+            await db_session.close()
+
+    monkeypatch.setitem(main_app.dependency_overrides, get_db_session, yield_db_session)
+    monkeypatch.setattr(TaskCRUD, "stream_yield_per", 1)
+    tasks_data = [
+        {"datetime_to_do": datetime.now(timezone.utc), "task_info": f"Streamed task {i}"}
+        for i in range(3)
+    ]
+    response = await async_client.post(
+        f"{PREFIX}/bulk",
+        json=[{**task, "datetime_to_do": task["datetime_to_do"].isoformat()} for task in tasks_data],
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = await async_client.get(f"{PREFIX}/list")
+    assert response.status_code == status.HTTP_200_OK
+    assert [task["task_info"] for task in response.json()] == [task["task_info"] for task in tasks_data]
@@ -0,0 +1,95 @@
+"""Authentication test module."""
+
+import time
+from typing import Generator, Optional
+
+import jwt
+import pytest
+from fastapi import HTTPException, status
+
+from app import auth
+from app.auth import _token_cache, get_current_user
+from app.schemas import TokenData
+
+
+# Signing settings of the tests, independent of AUTH__* environment variables
+TEST_SECRET_KEY = "test-secret-key-of-at-least-32-bytes"
+TEST_ALGORITHM = "HS256"
+
+
+def _make_token(
+        name: Optional[str] = "testuser",
+        expires_in: Optional[int] = 60,
+        key: str = TEST_SECRET_KEY,
+) -> str:
+    """Encode a JWT with the given ``name`` claim and lifetime in seconds."""
+    payload = {}
+    if name is not None:
+        payload["name"] = name
+    if expires_in is not None:
+        payload["exp"] = int(time.time()) + expires_in
+    return jwt.encode(payload, key, algorithm=TEST_ALGORITHM)
+
+
+@pytest.fixture(autouse=True)
+def signing_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make ``get_current_user`` verify tokens with the test signing settings."""
+    monkeypatch.setattr(auth, "SECRET_KEY", TEST_SECRET_KEY)
+    monkeypatch.setattr(auth, "ALGORITHM", TEST_ALGORITHM)
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache() -> Generator[None, None, None]:
+    """Start and finish every test with an empty token cache."""
+    _token_cache.clear()
+    yield
+    _token_cache.clear()
+
+
+@pytest.mark.parametrize(
+    "name, username",
+    [
+        ["testuser", "testuser"],
+        [None, "valid_user_placeholder"],
+    ]
+)
+@pytest.mark.asyncio
+async def test_get_current_user(name, username):
+    """Test that a valid token is decoded and cached."""
+    token = _make_token(name=name)
+
+    token_data = await get_current_user(token)
+    assert token_data.username == username
+    assert _token_cache[token][0] is token_data
+
+    assert await get_current_user(token) is token_data
+
+
+@pytest.mark.parametrize(
+    "token_kwargs",
+    [
+        {"expires_in": -60},
+        {"key": "wrong-secret-key-of-at-least-32-bytes"},
+        None,
+    ]
+)
+@pytest.mark.asyncio
+async def test_get_current_user_invalid(token_kwargs):
+    """Test that expired, forged and malformed tokens are rejected and not cached."""
+    token = _make_token(**token_kwargs) if token_kwargs is not None else "not-a-jwt"
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(token)
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert token not in _token_cache
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_cached_token_expired():
+    """Test that a cached token is not accepted past its own expiration time."""
+    token = _make_token(expires_in=-60)
+    _token_cache[token] = (TokenData(username="testuser"), time.time() - 60)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(token)
+    assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert token not in _token_cache
@@ -0,0 +1,89 @@
+"""Test helpers shared by fixtures and tests."""
+
+import asyncio
+from typing import Any, NamedTuple, Optional
+from urllib.parse import urlencode
+
+import orjson
+
+
+class ShimResponse(NamedTuple):
+    """Minimal response returned by ``ASGIShim``."""
+
+    status_code: int
+    content: bytes
+
+    def json(self) -> Any:
+        """Decode the response body as JSON."""
+        return orjson.loads(self.content)
+
+
+class ASGIShim:
+    """Call the application in-process without an HTTP client.
+
+    Requests are passed to the ASGI app as a prebuilt scope, skipping
+    httpx's URL parsing, request building and transport layers. Use it for
+    tests that only need a status code and a JSON body.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def call(
+            self,
+            path: str,
+            method: str = "GET",
+            json: Any = None,
+            params: Optional[dict] = None,
+    ) -> ShimResponse:
+        """Send a request to the application.
+
+        Args:
+            path (str): Request path
+            method (str): HTTP method
+            json (Any): Body encoded as JSON, if any
+            params (Optional[dict]): Query parameters
+
+        Returns:
+            ShimResponse: Response status and body
+        """
+        body = orjson.dumps(json) if json is not None else b""
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": urlencode(params, doseq=True).encode() if params else b"",
+            "headers": [(b"host", b"testserver"), (b"content-type", b"application/json")],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+        }
+        request_sent = False
+        response_complete = asyncio.Event()
+        status_code = 0
+        chunks = []
+
+        async def receive() -> dict:
+            nonlocal request_sent
+            if request_sent:
+                # Streaming responses watch for a disconnect while sending
+                await response_complete.wait()
+                return {"type": "http.disconnect"}
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message: dict) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response_complete.set()
+
+        await self.app(scope, receive, send)
+        return ShimResponse(status_code, b"".join(chunks))